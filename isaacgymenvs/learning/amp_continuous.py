@@ -29,23 +29,15 @@
 from rl_games.algos_torch.running_mean_std import RunningMeanStd
 from rl_games.algos_torch import torch_ext
 from rl_games.common import a2c_common
-from rl_games.common import schedulers
-from rl_games.common import vecenv
-
-from isaacgymenvs.utils.torch_jit_utils import to_torch
 
 import time
-from datetime import datetime
 import numpy as np
-from torch import optim
 import torch 
 from torch import nn
 
 import isaacgymenvs.learning.replay_buffer as replay_buffer
 import isaacgymenvs.learning.common_agent as common_agent 
 
-from tensorboardX import SummaryWriter
-
 
 class AMPAgent(common_agent.CommonAgent):
 
@@ -134,8 +126,8 @@ class AMPAgent(common_agent.CommonAgent):
 
             not_dones = 1.0 - self.dones.float()
 
-            self.current_rewards = self.current_rewards * not_dones.unsqueeze(1)
-            self.current_lengths = self.current_lengths * not_dones
+            self.current_rewards *= not_dones.unsqueeze(1)
+            self.current_lengths *= not_dones
         
             if (self.vec_env.env.viewer and (n == (self.horizon_length - 1))):
                 self._amp_debug(infos)
@@ -452,7 +444,7 @@ class AMPAgent(common_agent.CommonAgent):
 
     def _build_amp_buffers(self):
         batch_shape = self.experience_buffer.obs_base_shape
-        self.experience_buffer.tensor_dict['amp_obs'] = torch.zeros(batch_shape + self._amp_observation_space.shape,
+        self.experience_buffer.tensor_dict['amp_obs'] = torch.empty(batch_shape + self._amp_observation_space.shape,
                                                                     device=self.ppo_device)
         
         amp_obs_demo_buffer_size = int(self.config['amp_obs_demo_buffer_size'])
@@ -506,7 +498,7 @@ class AMPAgent(common_agent.CommonAgent):
         with torch.no_grad():
             disc_logits = self._eval_disc(amp_obs)
             prob = 1 / (1 + torch.exp(-disc_logits)) 
-            disc_r = -torch.log(torch.maximum(1 - prob, torch.tensor(0.0001, device=self.ppo_device)))
+            disc_r = -torch.log(torch.clamp_min(1 - prob, 0.0001))
             disc_r *= self._disc_reward_scale
         return disc_r
 
@@ -514,7 +506,7 @@ class AMPAgent(common_agent.CommonAgent):
         buf_size = self._amp_replay_buffer.get_buffer_size()
         buf_total_count = self._amp_replay_buffer.get_total_count()
         if (buf_total_count > buf_size):
-            keep_probs = to_torch(np.array([self._amp_replay_keep_prob] * amp_obs.shape[0]), device=self.ppo_device)
+            keep_probs = torch.full((amp_obs.shape[0],), self._amp_replay_keep_prob, device=self.ppo_device)
             keep_mask = torch.bernoulli(keep_probs) == 1.0
             amp_obs = amp_obs[keep_mask]
 
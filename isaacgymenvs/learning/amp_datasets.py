@@ -33,7 +33,7 @@ from rl_games.common import datasets
 class AMPDataset(datasets.PPODataset):
     def __init__(self, batch_size, minibatch_size, is_discrete, is_rnn, device, seq_len):
         super().__init__(batch_size, minibatch_size, is_discrete, is_rnn, device, seq_len)
-        self._idx_buf = torch.randperm(batch_size)
+        self._idx_buf = torch.randperm(batch_size, device=device)
         return
     
     def update_mu_sigma(self, mu, sigma):	  
@@ -56,5 +56,5 @@ class AMPDataset(datasets.PPODataset):
         return input_dict
 
     def _shuffle_idx_buf(self):
-        self._idx_buf[:] = torch.randperm(self.batch_size)
+        torch.randperm(self.batch_size, out=self._idx_buf)
         return
\ No newline at end of file
@@ -110,6 +110,6 @@ class AMPPlayerContinuous(common_player.CommonPlayer):
         with torch.no_grad():
             disc_logits = self._eval_disc(amp_obs)
             prob = 1.0 / (1.0 + torch.exp(-disc_logits)) 
-            disc_r = -torch.log(torch.maximum(1 - prob, torch.tensor(0.0001, device=self.device)))
+            disc_r = -torch.log(torch.clamp_min(1 - prob, 0.0001))
             disc_r *= self._disc_reward_scale
         return disc_r
@@ -26,30 +26,21 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import copy
 from datetime import datetime
-from gym import spaces
-import numpy as np
 import os
 import time
-import yaml
 
 from rl_games.algos_torch import a2c_continuous
 from rl_games.algos_torch import torch_ext
 from rl_games.algos_torch import central_value
-from rl_games.algos_torch.running_mean_std import RunningMeanStd
 from rl_games.common import a2c_common
-from rl_games.common import datasets
-from rl_games.common import schedulers
-from rl_games.common import vecenv
 
 import torch
+from torch import nn
 from torch import optim
 
 from . import amp_datasets as amp_datasets
 
-from tensorboardX import SummaryWriter
-
 
 class CommonAgent(a2c_continuous.A2CAgent):
 
@@ -102,8 +93,8 @@ class CommonAgent(a2c_continuous.A2CAgent):
 
     def init_tensors(self):
         super().init_tensors()
-        self.experience_buffer.tensor_dict['next_obses'] = torch.zeros_like(self.experience_buffer.tensor_dict['obses'])
-        self.experience_buffer.tensor_dict['next_values'] = torch.zeros_like(self.experience_buffer.tensor_dict['values'])
+        self.experience_buffer.tensor_dict['next_obses'] = torch.empty_like(self.experience_buffer.tensor_dict['obses'])
+        self.experience_buffer.tensor_dict['next_values'] = torch.empty_like(self.experience_buffer.tensor_dict['values'])
 
         self.tensor_list += ['next_obses']
         return
@@ -211,7 +202,6 @@ class CommonAgent(a2c_continuous.A2CAgent):
             ep_kls = []
             for i in range(len(self.dataset)):
                 curr_train_info = self.train_actor_critic(self.dataset[i])
-                print(type(curr_train_info))
                 
                 if self.schedule_type == 'legacy':
                     self.last_lr, self.entropy_coef = self.scheduler.update(self.last_lr, self.entropy_coef, self.epoch_num, 0, curr_train_info['kl'].item())
@@ -292,8 +282,8 @@ class CommonAgent(a2c_continuous.A2CAgent):
 
             not_dones = 1.0 - self.dones.float()
 
-            self.current_rewards = self.current_rewards * not_dones.unsqueeze(1)
-            self.current_lengths = self.current_lengths * not_dones
+            self.current_rewards *= not_dones.unsqueeze(1)
+            self.current_lengths *= not_dones
 
         mb_fdones = self.experience_buffer.tensor_dict['dones'].float()
         mb_values = self.experience_buffer.tensor_dict['values']
@@ -420,8 +410,8 @@ class CommonAgent(a2c_continuous.A2CAgent):
     def bound_loss(self, mu):
         if self.bounds_loss_coef is not None:
             soft_bound = 1.0
-            mu_loss_high = torch.maximum(mu - soft_bound, torch.tensor(0, device=self.ppo_device))**2
-            mu_loss_low = torch.minimum(mu + soft_bound, torch.tensor(0, device=self.ppo_device))**2
+            mu_loss_high = torch.clamp_min(mu - soft_bound, 0.0)**2
+            mu_loss_low = torch.clamp_max(mu + soft_bound, 0.0)**2
             b_loss = (mu_loss_low + mu_loss_high).sum(axis=-1)
         else:
             b_loss = 0
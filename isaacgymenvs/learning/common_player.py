@@ -51,6 +51,7 @@ class CommonPlayer(players.PpoPlayerContinuous):
         
         return
 
+    @torch.inference_mode()
     def run(self):
         n_games = self.games_num
         render = self.render_env
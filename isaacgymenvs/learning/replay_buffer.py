@@ -36,7 +36,7 @@ class ReplayBuffer():
         self._buffer_size = buffer_size
         self._device = device
         self._data_buf = None
-        self._sample_idx = torch.randperm(buffer_size)
+        self._sample_idx = torch.randperm(buffer_size, device=self._device)
         self._sample_head = 0
 
         return
@@ -81,7 +81,7 @@ class ReplayBuffer():
         total_count = self.get_total_count()
         buffer_size = self.get_buffer_size()
 
-        idx = torch.arange(self._sample_head, self._sample_head + n)
+        idx = torch.arange(self._sample_head, self._sample_head + n, device=self._device)
         idx = idx % buffer_size
         rand_idx = self._sample_idx[idx]
         if (total_count < buffer_size):
@@ -99,7 +99,7 @@ class ReplayBuffer():
 
     def _reset_sample_idx(self):
         buffer_size = self.get_buffer_size()
-        self._sample_idx[:] = torch.randperm(buffer_size)
+        torch.randperm(buffer_size, out=self._sample_idx)
         self._sample_head = 0
         return
 
@@ -109,6 +109,6 @@ class ReplayBuffer():
 
         for k, v in data_dict.items():
             v_shape = v.shape[1:]
-            self._data_buf[k] = torch.zeros((buffer_size,) + v_shape, device=self._device)
+            self._data_buf[k] = torch.empty((buffer_size,) + v_shape, device=self._device)
 
         return
\ No newline at end of file
@@ -241,8 +241,8 @@ class PbtAlgoObserver(AlgoObserver):
             done_indices_lst = done_indices.squeeze(-1).tolist()
             self.finished_agents.update(done_indices_lst)
 
-            for done_idx in done_indices_lst:
-                true_objective_value = infos["true_objective"][done_idx].item()
+            true_objective_values = infos["true_objective"][done_indices_lst].tolist()
+            for done_idx, true_objective_value in zip(done_indices_lst, true_objective_values):
                 self.last_target_objectives[done_idx] = true_objective_value
 
             # last result for all episodes
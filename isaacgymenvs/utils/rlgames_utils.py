@@ -160,16 +160,16 @@ class RLGPUAlgoObserver(AlgoObserver):
                     self.episode_cumulative[key] = torch.zeros_like(value)
                 self.episode_cumulative[key] += value
 
-            for done_idx in done_indices:
+            if len(done_indices) > 0:
                 self.new_finished_episodes = True
-                done_idx = done_idx.item()
+                done_indices_flat = done_indices.squeeze(-1)
 
-                for key, value in infos['episode_cumulative'].items():
+                for key in infos['episode_cumulative']:
                     if key not in self.episode_cumulative_avg:
                         self.episode_cumulative_avg[key] = deque([], maxlen=self.algo.games_to_track)
 
-                    self.episode_cumulative_avg[key].append(self.episode_cumulative[key][done_idx].item())
-                    self.episode_cumulative[key][done_idx] = 0
+                    self.episode_cumulative_avg[key].extend(self.episode_cumulative[key][done_indices_flat].tolist())
+                    self.episode_cumulative[key][done_indices_flat] = 0
 
         # turn nested infos into summary keys (i.e. infos['scalars']['lr'] -> infos['scalars/lr']
         if len(infos) > 0 and isinstance(infos, dict):  # allow direct logging from env
@@ -183,15 +183,16 @@ class RLGPUAlgoObserver(AlgoObserver):
     def after_print_stats(self, frame, epoch_num, total_time):
         if self.ep_infos:
             for key in self.ep_infos[0]:
-                infotensor = torch.tensor([], device=self.algo.device)
+                infotensors = []
                 for ep_info in self.ep_infos:
                     # handle scalar and zero dimensional tensor infos
                     if not isinstance(ep_info[key], torch.Tensor):
                         ep_info[key] = torch.Tensor([ep_info[key]])
                     if len(ep_info[key].shape) == 0:
                         ep_info[key] = ep_info[key].unsqueeze(0)
-                    infotensor = torch.cat((infotensor, ep_info[key].to(self.algo.device)))
-                value = torch.mean(infotensor)
+                    infotensors.append(ep_info[key].to(self.algo.device))
+                # concatenate once instead of growing the tensor for every stored info
+                value = torch.mean(torch.cat(infotensors).float())
                 self.writer.add_scalar('Episode/' + key, value, epoch_num)
             self.ep_infos.clear()
         